@@ -0,0 +1,27 @@
+from aws_lambda_powertools.event_handler.api_gateway import (
+    APIGatewayHttpResolver,
+    CORSConfig,
+)
+
+# Imported eagerly so the DynamoDB client is created and warmed during INIT
+import src.common.aws  # noqa: F401
+from src.common.serialization import dumps
+
+import availabilities
+import book
+import bookings
+import event_types
+
+cors_config = CORSConfig(allow_origin="*")
+app = APIGatewayHttpResolver(cors=cors_config, serializer=dumps)
+
+app.include_router(availabilities.router)
+app.include_router(book.router)
+app.include_router(bookings.router)
+app.include_router(event_types.router)
+
+
+def lambda_handler(event, context):
+    # Read the query string once per request; routes pick it up from the context
+    app.append_context(query_params=event.get("queryStringParameters") or {})
+    return app.resolve(event, context)
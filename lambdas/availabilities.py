@@ -1,53 +1,54 @@
-import json
-from aws_lambda_powertools import Logger
-from aws_lambda_powertools.event_handler.api_gateway import (
-    APIGatewayRestResolver,
-    CORSConfig,
-)
+from aws_lambda_powertools.event_handler.api_gateway import Router
 
-from src.availabilities.availabilities import delete, get, update, create
+from src.common.validation import get_query_params
 
-logger = Logger()
+router = Router()
 
-cors_config = CORSConfig(allow_origin="*")
-app = APIGatewayRestResolver(cors=cors_config)
 
-
-@app.get("/availabilities")
+@router.get("/availabilities")
 def get_availabilities():
-    query_params = app.current_event.query_string_parameters
+    from src.availabilities.availabilities import get
+
+    query_params = get_query_params(router.context["query_params"], "id")
     id = query_params["id"]
 
     return get(id)
 
 
-@app.post("/availabilities")
+@router.post("/availabilities")
 def create_availability():
-    query_params = app.current_event.query_string_parameters
+    from src.availabilities.availabilities import create
+
+    query_params = get_query_params(router.context["query_params"], "id", "name")
     id = query_params["id"]
     name = query_params["name"]
 
     return create(id, name)
 
 
-@app.put("/availabilities")
+@router.put("/availabilities")
 def update_availability():
-    query_params = app.current_event.query_string_parameters
+    from src.availabilities.availabilities import update
+    from src.common.validation import get_json_body
+
+    query_params = get_query_params(
+        router.context["query_params"], "id", "availability_id"
+    )
     id = query_params["id"]
     availability_id = query_params["availability_id"]
-    availability = app.current_event.json_body
+    availability = get_json_body(router.current_event, "availability")
 
     return update(id, availability_id, availability)
 
 
-@app.delete("/availabilities")
+@router.delete("/availabilities")
 def delete_availability():
-    query_params = app.current_event.query_string_parameters
+    from src.availabilities.availabilities import delete
+
+    query_params = get_query_params(
+        router.context["query_params"], "id", "availability_id"
+    )
     id = query_params["id"]
     availability_id = query_params["availability_id"]
 
     return delete(id, availability_id)
-
-
-def lambda_handler(event, context):
-    return app.resolve(event, context)
@@ -1,34 +1,24 @@
-from aws_lambda_powertools import Logger
-from aws_lambda_powertools.event_handler.api_gateway import (
-    APIGatewayRestResolver,
-    CORSConfig,
-)
-from src.book.book import (
-    get_availabilities_for_url,
-    get_event_type_for_url,
-    get_event_types_for_username,
-)
+from aws_lambda_powertools.event_handler.api_gateway import Router
 
-logger = Logger()
+router = Router()
 
-cors_config = CORSConfig(allow_origin="*")
-app = APIGatewayRestResolver(cors=cors_config)
 
-
-@app.get("/book/<username>")
+@router.get("/book/<username>")
 def get_event_types(username: str):
+    from src.book.book import get_event_types_for_username
+
     return get_event_types_for_username(username)
 
 
-@app.get("/book/<username>/<url>")
+@router.get("/book/<username>/<url>")
 def get_event_type(username: str, url: str):
+    from src.book.book import get_event_type_for_url
+
     return get_event_type_for_url(username, url)
 
 
-@app.get("/book/<username>/<url>/availabilities")
+@router.get("/book/<username>/<url>/availabilities")
 def get_availabilities(username: str, url: str):
-    return get_availabilities_for_url(username, url)
-
+    from src.book.book import get_availabilities_for_url
 
-def lambda_handler(event, context):
-    return app.resolve(event, context)
+    return get_availabilities_for_url(username, url)
@@ -1,44 +1,40 @@
-import json
-from aws_lambda_powertools import Logger
-from aws_lambda_powertools.event_handler.api_gateway import (
-    APIGatewayRestResolver,
-    CORSConfig,
-)
+from aws_lambda_powertools.event_handler.api_gateway import Router
 
-from src.bookings.bookings import get, update, create
+from src.common.validation import get_query_params
 
-logger = Logger()
+router = Router()
 
-cors_config = CORSConfig(allow_origin="*")
-app = APIGatewayRestResolver(cors=cors_config)
 
-
-@app.get("/bookings")
+@router.get("/bookings")
 def get_availabilities():
-    query_params = app.current_event.query_string_parameters
+    from src.bookings.bookings import get
+
+    query_params = get_query_params(router.context["query_params"], "id")
     id = query_params["id"]
 
     return get(id)
 
 
-@app.post("/bookings")
+@router.post("/bookings")
 def create_availability():
-    query_params = app.current_event.query_string_parameters
+    from src.bookings.bookings import create
+    from src.common.validation import get_json_body
+
+    query_params = get_query_params(router.context["query_params"], "id")
     id = query_params["id"]
-    booking = app.current_event.json_body
+    booking = get_json_body(router.current_event, "booking")
 
     return create(id, booking)
 
 
-@app.put("/bookings")
+@router.put("/bookings")
 def update_availability():
-    query_params = app.current_event.query_string_parameters
+    from src.bookings.bookings import update
+    from src.common.validation import get_json_body
+
+    query_params = get_query_params(router.context["query_params"], "id", "booking_id")
     id = query_params["id"]
     booking_id = query_params["booking_id"]
-    booking = app.current_event.json_body
+    booking = get_json_body(router.current_event, "booking")
 
     return update(id, booking_id, booking)
-
-
-def lambda_handler(event, context):
-    return app.resolve(event, context)
@@ -0,0 +1,55 @@
+from aws_lambda_powertools.event_handler.api_gateway import Router
+
+from src.common.validation import get_query_params
+
+router = Router()
+
+
+@router.get("/event-types")
+def get_event_types():
+    from src.event_types.event_types import get
+
+    query_params = get_query_params(router.context["query_params"], "id")
+    id = query_params["id"]
+
+    return get(id)
+
+
+@router.post("/event-types")
+def create_event_type():
+    from src.common.validation import get_json_body
+    from src.event_types.event_types import create
+
+    query_params = get_query_params(router.context["query_params"], "id")
+    id = query_params["id"]
+    event_type = get_json_body(router.current_event, "event_type")
+
+    return create(id, event_type)
+
+
+@router.put("/event-types")
+def update_event_type():
+    from src.common.validation import get_json_body
+    from src.event_types.event_types import update
+
+    query_params = get_query_params(
+        router.context["query_params"], "id", "event_type_id"
+    )
+    id = query_params["id"]
+    event_type_id = query_params["event_type_id"]
+    event_type = get_json_body(router.current_event, "event_type")
+
+    return update(id, event_type_id, event_type)
+
+
+@router.delete("/event-types")
+def delete_event_type():
+    from src.event_types.event_types import delete
+
+    query_params = get_query_params(
+        router.context["query_params"], "id", "event_type_id"
+    )
+    id = query_params["id"]
+    event_type_id = query_params["event_type_id"]
+
+    return delete(id, event_type_id)
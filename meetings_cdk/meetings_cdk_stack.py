@@ -1,11 +1,13 @@
 from aws_cdk import (
+    BundlingOptions,
     Duration,
     Stack,
     aws_dynamodb as ddb,
-    aws_apigateway as apigw,
+    aws_apigatewayv2_alpha as apigwv2,
     aws_lambda as _lambda,
     aws_ssm as ssm,
 )
+from aws_cdk.aws_apigatewayv2_integrations_alpha import HttpLambdaIntegration
 from constructs import Construct
 
 
@@ -29,318 +31,176 @@ class MeetingsCdkStack(Stack):
             sort_key=ddb.Attribute(name="url", type=ddb.AttributeType.STRING),
         )
 
+        # Graviton is cheaper per GB-second and every dependency is pure Python
+        architecture = _lambda.Architecture.ARM_64
+
         # Create Lambda Layer
 
+        # Install the packages listed in lambdas/layer/requirements.txt. Only
+        # DynamoDB is called, so drop every other botocore service model and the
+        # bytecode caches of bundled test suites to keep the layer small
+        slim_layer = " && ".join(
+            [
+                "cp -au . /asset-output",
+                "pip install -r requirements.txt -t /asset-output/python",
+                "cd /asset-output",
+                "if [ -d python/botocore/data ]; then"
+                " find python/botocore/data -mindepth 1 -maxdepth 1"
+                " ! -name dynamodb ! -name endpoints.json ! -name partitions.json"
+                " ! -name _retry.json ! -name sdk-default-configuration.json"
+                " -exec rm -rf {} +; fi",
+                "find . -path '*/tests/*' -name __pycache__ -prune -exec rm -rf {} +",
+            ]
+        )
+
         my_layer = _lambda.LayerVersion(
             self,
             "MyLayer",
-            code=_lambda.Code.from_asset("lambdas/layer"),
+            code=_lambda.Code.from_asset(
+                "lambdas/layer",
+                bundling=BundlingOptions(
+                    image=_lambda.Runtime.PYTHON_3_11.bundling_image,
+                    platform=architecture.docker_platform,
+                    command=["bash", "-c", slim_layer],
+                ),
+            ),
             compatible_runtimes=[_lambda.Runtime.PYTHON_3_11],
+            compatible_architectures=[architecture],
         )
 
         powertools_for_aws_lambda = _lambda.LayerVersion.from_layer_version_arn(
             self,
             "powertools",
-            "arn:aws:lambda:us-east-1:017000801446:layer:AWSLambdaPowertoolsPythonV2:45",
+            "arn:aws:lambda:us-east-1:017000801446:layer:AWSLambdaPowertoolsPythonV2-Arm64:45",
         )
 
         parameter_value = ssm.StringParameter.from_string_parameter_name(
             self, "IntegrationsAPI", "/api/integrations"
         ).string_value
 
-        # Create Lambda functions
-        def create_lambda_function(name: str):
+        # Ship the handlers as precompiled bytecode so imports skip compilation on
+        # cold start; the layer directory is deployed separately above
+        precompile_handlers = " && ".join(
+            [
+                "cp -au . /asset-output",
+                "cd /asset-output",
+                "rm -rf layer",
+                "python -m compileall -b -q .",
+                "find . -name '*.py' -delete",
+                "find . -name __pycache__ -prune -exec rm -rf {} +",
+            ]
+        )
+
+        # Create Lambda function
+        def create_lambda_function(name: str, memory_size: int):
             return _lambda.Function(
                 self,
                 f"{name}",
                 runtime=_lambda.Runtime.PYTHON_3_11,
+                architecture=architecture,
                 handler=f"{name}.lambda_handler",
-                code=_lambda.Code.from_asset(f"lambdas/"),
+                code=_lambda.Code.from_asset(
+                    "lambdas/",
+                    bundling=BundlingOptions(
+                        image=_lambda.Runtime.PYTHON_3_11.bundling_image,
+                        platform=architecture.docker_platform,
+                        command=["bash", "-c", precompile_handlers],
+                    ),
+                ),
                 environment={
                     "TABLE_NAME": meetings.table_name,
                     "INTEGRATIONS_API_URL": parameter_value,
+                    # The deployment package is read-only; don't try to write .pyc
+                    "PYTHONDONTWRITEBYTECODE": "1",
                 },
                 layers=[my_layer, powertools_for_aws_lambda],
                 timeout=Duration.seconds(30),
-                memory_size=1400,
+                memory_size=memory_size,
             )
 
-        event_types_lambda = create_lambda_function("event-types")
-        bookings_lambda = create_lambda_function("bookings")
-        availabilities_lambda = create_lambda_function("availabilities")
-        book_lambda = create_lambda_function("book")
+        # A single function serves every route so all endpoints share warm instances.
+        # 1769 MB is the smallest size that gets a full vCPU: cold-start imports and
+        # the slot calculation behind the public booking pages are CPU bound, while
+        # 1400 MB paid for memory the handlers never use.
+        api_lambda = create_lambda_function("api", memory_size=1769)
 
-        # Grant DynamoDB table permissions to Lambda functions
-        meetings.grant_full_access(event_types_lambda)
-        meetings.grant_full_access(bookings_lambda)
-        meetings.grant_full_access(availabilities_lambda)
-        meetings.grant_full_access(book_lambda)
+        # Grant DynamoDB table permissions to Lambda function
+        meetings.grant_full_access(api_lambda)
 
-        # Create API Gateway
-        api = apigw.RestApi(
+        # Keep instances initialised for the public booking pages; with every route
+        # on one function, the warm pool covers the other endpoints as well
+        api_alias = _lambda.Alias(
             self,
-            "MyApi",
-            default_cors_preflight_options=apigw.CorsOptions(
-                allow_origins=apigw.Cors.ALL_ORIGINS
-            ),
+            "ApiLive",
+            alias_name="live",
+            version=api_lambda.current_version,
+            provisioned_concurrent_executions=2,
         )
 
-        validate_all = apigw.RequestValidator(
+        # Create API Gateway. An HTTP API routes with less latency than a REST API;
+        # request bodies and query strings are validated in the handler instead.
+        api = apigwv2.HttpApi(
             self,
-            "ValidateAll",
-            rest_api=api,
-            validate_request_body=True,
-            validate_request_parameters=True,
-        )
-
-        # Availabilities Resource
-
-        availability_model = apigw.Model(
-            self,
-            "AvailabilityModel",
-            rest_api=api,
-            schema=apigw.JsonSchema(
-                schema=apigw.JsonSchemaVersion.DRAFT7,
-                type=apigw.JsonSchemaType.OBJECT,
-                properties={
-                    "name": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                    "availabilities": apigw.JsonSchema(
-                        type=apigw.JsonSchemaType.ARRAY,
-                        items=apigw.JsonSchema(
-                            type=apigw.JsonSchemaType.ARRAY,
-                            items=apigw.JsonSchema(
-                                type=apigw.JsonSchemaType.OBJECT,
-                                properties={
-                                    "start": apigw.JsonSchema(
-                                        type=apigw.JsonSchemaType.STRING,
-                                        pattern="^([0-1][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]$",
-                                    ),
-                                    "end": apigw.JsonSchema(
-                                        type=apigw.JsonSchemaType.STRING,
-                                        pattern="^([0-1][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]$",
-                                    ),
-                                },
-                                required=["start", "end"],
-                                additional_properties=False,
-                            ),
-                        ),
-                        min_items=7,
-                        max_items=7,
-                    ),
-                },
-                required=["name", "availabilities"],
-                additional_properties=False,
+            "MyApi",
+            cors_preflight=apigwv2.CorsPreflightOptions(
+                allow_origins=["*"],
+                allow_methods=[apigwv2.CorsHttpMethod.ANY],
+                allow_headers=["*"],
             ),
         )
 
-        availabilities = api.root.add_resource("availabilities")
-        availabilities.add_method(
-            "GET",
-            apigw.LambdaIntegration(availabilities_lambda),
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-            },
-        )
-        availabilities.add_method(
-            "POST",
-            apigw.LambdaIntegration(availabilities_lambda),
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-                "method.request.querystring.name": True,
-            },
-        )
-
-        availabilities.add_method(
-            "PUT",
-            apigw.LambdaIntegration(availabilities_lambda),
-            request_models={"application/json": availability_model},
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-                "method.request.querystring.availability_id": True,
-            },
-        )
-        availabilities.add_method(
-            "DELETE",
-            apigw.LambdaIntegration(availabilities_lambda),
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-                "method.request.querystring.availability_id": True,
-            },
-        )
+        api_integration = HttpLambdaIntegration("ApiIntegration", api_alias)
 
-        # event-types
+        # Availabilities Resource
 
-        event_type_model = apigw.Model(
-            self,
-            "EventTypeModel",
-            rest_api=api,
-            schema=apigw.JsonSchema(
-                schema=apigw.JsonSchemaVersion.DRAFT7,
-                type=apigw.JsonSchemaType.OBJECT,
-                properties={
-                    "name": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                    "description": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                    "url": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                    "duration": apigw.JsonSchema(type=apigw.JsonSchemaType.NUMBER),
-                    "availability_id": apigw.JsonSchema(
-                        type=apigw.JsonSchemaType.STRING
-                    ),
-                    "hidden": apigw.JsonSchema(type=apigw.JsonSchemaType.BOOLEAN),
-                },
-                required=[
-                    "name",
-                    "description",
-                    "url",
-                    "duration",
-                    "availability_id",
-                    "hidden",
-                ],
-                additional_properties=False,
-            ),
+        api.add_routes(
+            path="/availabilities",
+            methods=[
+                apigwv2.HttpMethod.GET,
+                apigwv2.HttpMethod.POST,
+                apigwv2.HttpMethod.PUT,
+                apigwv2.HttpMethod.DELETE,
+            ],
+            integration=api_integration,
         )
 
-        event_type = api.root.add_resource("event-types")
-        event_type.add_method(
-            "GET",
-            apigw.LambdaIntegration(event_types_lambda),
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-            },
-        )
-        event_type.add_method(
-            "POST",
-            apigw.LambdaIntegration(event_types_lambda),
-            request_models={"application/json": event_type_model},
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-            },
-        )
+        # event-types
 
-        event_type.add_method(
-            "PUT",
-            apigw.LambdaIntegration(event_types_lambda),
-            request_models={"application/json": event_type_model},
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-                "method.request.querystring.event_type_id": True,
-            },
-        )
-        event_type.add_method(
-            "DELETE",
-            apigw.LambdaIntegration(event_types_lambda),
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-                "method.request.querystring.event_type_id": True,
-            },
+        api.add_routes(
+            path="/event-types",
+            methods=[
+                apigwv2.HttpMethod.GET,
+                apigwv2.HttpMethod.POST,
+                apigwv2.HttpMethod.PUT,
+                apigwv2.HttpMethod.DELETE,
+            ],
+            integration=api_integration,
         )
 
         # bookings
-        booking_model = apigw.Model(
-            self,
-            "BookingModel",
-            rest_api=api,
-            schema=apigw.JsonSchema(
-                schema=apigw.JsonSchemaVersion.DRAFT7,
-                type=apigw.JsonSchemaType.OBJECT,
-                properties={
-                    "name": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                    "date": apigw.JsonSchema(
-                        type=apigw.JsonSchemaType.STRING,
-                        pattern="[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z",
-                    ),
-                    "host": apigw.JsonSchema(
-                        type=apigw.JsonSchemaType.OBJECT,
-                        properties={
-                            "name": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                            "email": apigw.JsonSchema(type=apigw.JsonSchemaType.STRING),
-                        },
-                        required=["name", "email"],
-                    ),
-                    "guests": apigw.JsonSchema(
-                        type=apigw.JsonSchemaType.ARRAY,
-                        items=apigw.JsonSchema(
-                            type=apigw.JsonSchemaType.OBJECT,
-                            properties={
-                                "name": apigw.JsonSchema(
-                                    type=apigw.JsonSchemaType.STRING
-                                ),
-                                "email": apigw.JsonSchema(
-                                    type=apigw.JsonSchemaType.STRING
-                                ),
-                            },
-                            required=["name", "email"],
-                        ),
-                    ),
-                },
-                required=["name", "date", "host", "guests"],
-                additional_properties=False,
-            ),
-        )
 
-        bookings = api.root.add_resource("bookings")
-        bookings.add_method(
-            "GET",
-            apigw.LambdaIntegration(bookings_lambda),
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-            },
-        )
-        bookings.add_method(
-            "POST",
-            apigw.LambdaIntegration(bookings_lambda),
-            request_models={"application/json": booking_model},
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-            },
-        )
-
-        bookings.add_method(
-            "PUT",
-            apigw.LambdaIntegration(bookings_lambda),
-            request_models={"application/json": booking_model},
-            request_validator=validate_all,
-            request_parameters={
-                "method.request.querystring.id": True,
-                "method.request.querystring.booking_id": True,
-            },
+        api.add_routes(
+            path="/bookings",
+            methods=[
+                apigwv2.HttpMethod.GET,
+                apigwv2.HttpMethod.POST,
+                apigwv2.HttpMethod.PUT,
+            ],
+            integration=api_integration,
         )
 
         # book
 
-        username_resource = api.root.add_resource("book").add_resource("{username}")
-
-        # Attach a GET method to book/{username}
-        username_resource.add_method(
-            "GET",
-            apigw.LambdaIntegration(book_lambda),
-        )
-
-        # Create the nested resource book/{username}/{url}
-        url_resource = username_resource.add_resource("{url}")
-
-        # Attach a GET method to book/{username}/{url}
-        url_resource.add_method(
-            "GET",
-            apigw.LambdaIntegration(book_lambda),
-        )
-
-        # Create the nested resource book/{username}/{url}/availabilities
-        availabilities_resource = url_resource.add_resource("availabilities")
-
-        availabilities_resource.add_method(
-            "GET",
-            apigw.LambdaIntegration(book_lambda),
-        )
+        for path in [
+            "/book/{username}",
+            "/book/{username}/{url}",
+            "/book/{username}/{url}/availabilities",
+        ]:
+            api.add_routes(
+                path=path,
+                methods=[apigwv2.HttpMethod.GET],
+                integration=api_integration,
+            )
 
         # # Send Email After Event Success
         # email_lambda = _lambda.Function(
@@ -0,0 +1,7 @@
+def __getattr__(name):
+    # Defer creating the DynamoDB table until something actually asks for it
+    if name == "table":
+        from .availabilities import table
+
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,47 +1,30 @@
-import os
-import boto3
-import uuid
-from typing import Any, Union, Optional
+from typing import Any, Union
 from botocore.exceptions import ClientError
-from datetime import time
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.event_handler.exceptions import (
     InternalServerError,
     NotFoundError,
 )
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+from src.common.aws import (
+    CLIENT as client,
+    PREFIX_KEY_CONDITION,
+    TABLE as table,
+    TABLE_NAME,
+)
 
 logger = Logger()
 
+AVAILABILITY_PREFIX = {"S": "AVAILABILITY:"}
 
-def convert_to_public_form(availability: dict[str, str]) -> Optional[dict[str, str]]:
-    """
-    Convert availability data to its public form.
-
-    Parameters:
-    - availability (dict): The original availability data.
-
-    Returns:
-    - dict or None: The availability data in its public form or None if an exception occurs.
-
-    Note:
-    - Exceptions will be logged using Lambda Powertools.
-    """
-    try:
-        return {
-            "owner": availability["id"],
-            "availability_id": availability["sortKey"].split(":")[1],
-            "name": availability["name"],
-            "data": availability["data"],
-            "timezone": availability["timezone"],
-        }
-    except Exception as e:
-        logger.error(
-            f"Error converting availability to public form. Exception: {str(e)}. Availability data: {availability}"
-        )
-        return None
+AVAILABILITY_PROJECTION = "id, sortKey, #name, #data, #timezone"
+AVAILABILITY_PROJECTION_NAMES = {
+    "#name": "name",
+    "#data": "data",
+    "#timezone": "timezone",
+}
+AVAILABILITY_UPDATE_EXPRESSION = "SET #data = :d, #name = :n"
+AVAILABILITY_UPDATE_NAMES = {"#data": "data", "#name": "name"}
 
 
 def get(id: str) -> dict[str, Union[int, str]]:
@@ -58,16 +41,35 @@ def get(id: str) -> dict[str, Union[int, str]]:
     - Exception: Generic exception if there's an unexpected error during the fetch operation.
     """
     try:
-        response = table.query(
-            KeyConditionExpression="id = :id AND begins_with(sortKey, :prefix)",
+        # Follow LastEvaluatedKey so partitions over 1 MB aren't truncated
+        pages = client.get_paginator("query").paginate(
+            TableName=TABLE_NAME,
+            KeyConditionExpression=PREFIX_KEY_CONDITION,
             ExpressionAttributeValues={
-                ":id": id,
-                ":prefix": "AVAILABILITY:",
+                ":id": {"S": id},
+                ":prefix": AVAILABILITY_PREFIX,
             },
+            ProjectionExpression=AVAILABILITY_PROJECTION,
+            ExpressionAttributeNames=AVAILABILITY_PROJECTION_NAMES,
         )
 
-        items = response.get("Items", [])
-        public_items = list(map(convert_to_public_form, items))
+        public_items = [
+            {
+                "owner": availability["id"]["S"],
+                "availability_id": availability["sortKey"]["S"].partition(":")[2],
+                "name": availability["name"]["S"],
+                "data": [
+                    [
+                        {"start": slot["M"]["start"]["S"], "end": slot["M"]["end"]["S"]}
+                        for slot in day["L"]
+                    ]
+                    for day in availability["data"]["L"]
+                ],
+                "timezone": availability["timezone"]["S"],
+            }
+            for page in pages
+            for availability in page["Items"]
+        ]
         logger.info(f"Fetched {len(public_items)} items for ID {id}.")
 
         return public_items
@@ -77,32 +79,6 @@ def get(id: str) -> dict[str, Union[int, str]]:
         raise InternalServerError("Internal server error")
 
 
-def default_availability() -> list[list[dict[str, str]]]:
-    """
-    Generate a default weekly availability.
-
-    The default availability is:
-    - From 09:00 to 17:00 on weekdays.
-    - No availability on weekends.
-
-    Returns:
-    - List[List[dict[str, str]]]: A weekly availability list containing daily availability slots.
-    """
-    availability = []
-    start = time(9, 0, 0).isoformat()
-    end = time(17, 0, 0).isoformat()
-    weekday_slot = [{"start": start, "end": end}]
-    weekend_slot = []
-
-    for day in range(7):
-        if day == 0 or day == 6:  # Sunday or Saturday
-            availability.append(weekend_slot)
-        else:
-            availability.append(weekday_slot)
-
-    return availability
-
-
 def create(id: str, name: str) -> dict[str, Union[int, str]]:
     """
     Create a new availability item in the table.
@@ -117,15 +93,19 @@ def create(id: str, name: str) -> dict[str, Union[int, str]]:
     Raises:
     - Exception: Generic exception if there's an unexpected error during the creation operation.
     """
+    import secrets
+
+    from .defaults import DEFAULT_AVAILABILITY
+
     try:
-        sortKey = f"AVAILABILITY:{uuid.uuid4()}"
+        sortKey = "AVAILABILITY:" + secrets.token_hex(16)
 
         table.put_item(
             Item={
                 "id": id,
                 "sortKey": sortKey,
                 "name": name,
-                "data": default_availability(),
+                "data": DEFAULT_AVAILABILITY,
                 "timezone": "America/New_York",
             }
         )
@@ -140,6 +120,50 @@ def create(id: str, name: str) -> dict[str, Union[int, str]]:
         raise InternalServerError("Internal server error")
 
 
+def create_many(id: str, names: list[str]) -> dict[str, Union[int, str]]:
+    """
+    Create several availability items in the table with batched writes.
+
+    Parameters:
+    - id (str): The main identifier for the table items.
+    - names (list[str]): Names of the availabilities to create.
+
+    Returns:
+    - dict: A dictionary containing a statusCode and a body message indicating the result of the operation.
+
+    Raises:
+    - Exception: Generic exception if there's an unexpected error during the creation operation.
+    """
+    import secrets
+
+    from .defaults import DEFAULT_AVAILABILITY
+
+    try:
+        # batch_writer sends up to 25 puts per BatchWriteItem and retries unprocessed items
+        with table.batch_writer() as batch:
+            for name in names:
+                batch.put_item(
+                    Item={
+                        "id": id,
+                        "sortKey": "AVAILABILITY:" + secrets.token_hex(16),
+                        "name": name,
+                        "data": DEFAULT_AVAILABILITY,
+                        "timezone": "America/New_York",
+                    }
+                )
+
+        logger.info(
+            f"{len(names)} availability items for ID {id} created successfully."
+        )
+        return "Items created", 201
+
+    except Exception as e:
+        logger.exception(
+            f"Error occurred while creating availabilities for user with ID {id}: {str(e)}"
+        )
+        raise InternalServerError("Internal server error")
+
+
 def update(
     id: str, availability_id: str, availability: dict[str, Any]
 ) -> dict[str, Union[int, str]]:
@@ -162,12 +186,12 @@ def update(
 
         table.update_item(
             Key={"id": id, "sortKey": sortKey},
-            UpdateExpression="SET #data = :d, #name = :n",
+            UpdateExpression=AVAILABILITY_UPDATE_EXPRESSION,
             ExpressionAttributeValues={
                 ":d": availability["availabilities"],
                 ":n": availability["name"],
             },
-            ExpressionAttributeNames={"#data": "data", "#name": "name"},
+            ExpressionAttributeNames=AVAILABILITY_UPDATE_NAMES,
             ConditionExpression="attribute_exists(id) AND attribute_exists(sortKey)",
         )
 
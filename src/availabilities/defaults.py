@@ -0,0 +1,13 @@
+# Default weekly availability, Sunday through Saturday:
+# - From 09:00 to 17:00 on weekdays.
+# - No availability on weekends.
+# Built once at import; put_item only reads it, so every create() can share it.
+DEFAULT_AVAILABILITY: list[list[dict[str, str]]] = [
+    [],
+    [{"start": "09:00:00", "end": "17:00:00"}],
+    [{"start": "09:00:00", "end": "17:00:00"}],
+    [{"start": "09:00:00", "end": "17:00:00"}],
+    [{"start": "09:00:00", "end": "17:00:00"}],
+    [{"start": "09:00:00", "end": "17:00:00"}],
+    [],
+]
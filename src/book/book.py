@@ -1,7 +1,5 @@
+from decimal import Decimal
 from typing import Union, Optional, Any
-import boto3
-import os
-import json
 
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.event_handler.exceptions import (
@@ -11,20 +9,37 @@ from aws_lambda_powertools.event_handler.exceptions import (
 
 from .calculate_availability import get_availabilities
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+from src.common.aws import CLIENT as client, DESERIALIZER, TABLE_NAME
+from src.common.cache import EVENT_TYPE_CACHE
 
 logger = Logger()
 
+# Key conditions on the UsernameUrlIndex GSI
+USERNAME_KEY_CONDITION = "#username = :username"
+USERNAME_URL_KEY_CONDITION = "#username = :username AND #url = :url"
+
+# The public listing reads these fields; the single lookup also needs the keys
+# of the availability row for get_availabilities_for_url
+EVENT_TYPE_NAMES = {
+    "#username": "username",
+    "#name": "name",
+    "#description": "description",
+    "#duration": "duration",
+    "#url": "url",
+    "#hidden": "hidden",
+}
+PUBLIC_EVENT_TYPE_PROJECTION = "#name, #description, #duration, #url, #hidden"
+EVENT_TYPE_PROJECTION = f"id, availability_id, {PUBLIC_EVENT_TYPE_PROJECTION}"
+
 
 def convert_to_public_form(
-    event: dict[str, Union[str, int]], filter_hidden: bool = True
+    event: dict[str, dict[str, Any]], filter_hidden: bool = True
 ) -> Optional[dict[str, Union[str, int]]]:
     """
     Convert raw event data to a public form.
 
     Parameters:
-    - event (dict): Contains the raw event data.
+    - event (dict): Contains the raw event item, as DynamoDB attribute values.
 
     Returns:
     - dict or None: The event in the desired public format or None if there's an exception during conversion.
@@ -33,14 +48,14 @@ def convert_to_public_form(
     If any exception occurs during conversion, this function will log the error and return None.
     """
     try:
-        if event["url"] == "RESERVED_FOR_INTERNAL_USE_ONLY" or (
-            filter_hidden and event["hidden"]
+        if event["url"]["S"] == "RESERVED_FOR_INTERNAL_USE_ONLY" or (
+            filter_hidden and event["hidden"]["BOOL"]
         ):
             return None
         return {
-            "name": event["name"],
-            "description": event["description"],
-            "duration": int(event["duration"]),
+            "name": event["name"]["S"],
+            "description": event["description"]["S"],
+            "duration": int(Decimal(event["duration"]["N"])),
         }
     except Exception as e:
         logger.exception(
@@ -63,14 +78,17 @@ def get_event_types_for_username(username: str) -> list[dict[str, Any]]:
         NotFoundError: If no event types are found for the username.
     """
     try:
-        # First query without filtering hidden attribute
-        response = table.query(
+        # First query without filtering hidden attribute, following
+        # LastEvaluatedKey so users with over 1 MB of event types aren't truncated
+        pages = client.get_paginator("query").paginate(
+            TableName=TABLE_NAME,
             IndexName="UsernameUrlIndex",
-            KeyConditionExpression="#username = :username",
-            ExpressionAttributeValues={":username": username},
-            ExpressionAttributeNames={"#username": "username"},
+            KeyConditionExpression=USERNAME_KEY_CONDITION,
+            ExpressionAttributeValues={":username": {"S": username}},
+            ProjectionExpression=PUBLIC_EVENT_TYPE_PROJECTION,
+            ExpressionAttributeNames=EVENT_TYPE_NAMES,
         )
-        items = response.get("Items", [])
+        items = [item for page in pages for item in page["Items"]]
 
         # If the list is empty, raise NotFoundError
         if not items:
@@ -79,7 +97,18 @@ def get_event_types_for_username(username: str) -> list[dict[str, Any]]:
             )
             raise NotFoundError(f"User with username {username} does not exist")
 
-        public_items = list(map(convert_to_public_form, items))
+        # Hidden event types and the reserved internal row are not listed publicly
+        public_items = [
+            {
+                "name": event["name"]["S"],
+                "description": event["description"]["S"],
+                "duration": int(Decimal(event["duration"]["N"])),
+            }
+            for event in items
+            # The reserved row is not an event type and need not have 'hidden'
+            if event["url"]["S"] != "RESERVED_FOR_INTERNAL_USE_ONLY"
+            and not event["hidden"]["BOOL"]
+        ]
         return public_items
     except NotFoundError as e:
         raise e
@@ -109,26 +138,39 @@ def get_event_type_for_url(
         raise NotFoundError("Reserved URL used.")
 
     try:
-        response = table.query(
-            IndexName="UsernameUrlIndex",
-            KeyConditionExpression="#username = :username AND #url = :url",
-            ExpressionAttributeValues={":username": username, ":url": url},
-            ExpressionAttributeNames={
-                "#username": "username",
-                "#url": "url",
-            },
-        )
-        items = response.get("Items", [])
-
-        if not items:
-            raise NotFoundError("No event type found for the given username and URL.")
-        elif len(items) > 1:
-            logger.error(
-                f"Multiple event types found for username {username} and URL {url}. Returning the first item."
+        # Event types change rarely, so warm containers reuse recent lookups. Both
+        # return paths build a new dict, so the cached item is never handed out.
+        item = EVENT_TYPE_CACHE.get((username, url))
+        if item is None:
+            response = client.query(
+                TableName=TABLE_NAME,
+                IndexName="UsernameUrlIndex",
+                KeyConditionExpression=USERNAME_URL_KEY_CONDITION,
+                ExpressionAttributeValues={
+                    ":username": {"S": username},
+                    ":url": {"S": url},
+                },
+                ProjectionExpression=EVENT_TYPE_PROJECTION,
+                ExpressionAttributeNames=EVENT_TYPE_NAMES,
             )
-            return convert_to_public_form(items[0]) if public_use else items[0]
-        else:
-            return convert_to_public_form(items[0]) if public_use else items[0]
+            items = response.get("Items", [])
+
+            if not items:
+                raise NotFoundError(
+                    "No event type found for the given username and URL."
+                )
+            elif len(items) > 1:
+                logger.error(
+                    f"Multiple event types found for username {username} and URL {url}. Returning the first item."
+                )
+
+            item = items[0]
+            EVENT_TYPE_CACHE[(username, url)] = item
+
+        if public_use:
+            return convert_to_public_form(item)
+        # Internal callers get the whole item as plain Python values
+        return {key: DESERIALIZER.deserialize(value) for key, value in item.items()}
     except NotFoundError as e:
         raise e
     except Exception as e:
@@ -154,9 +196,10 @@ def get_availabilities_for_url(username: str, url: str) -> dict[str, Any]:
         InternalServerError: If there's any unexpected error while processing.
     """
     try:
-        logger.info("hello")
+        # The calendar fetch waits on the lookup so an unknown URL costs no call
+        # to the integrations API; get_availabilities overlaps it with the
+        # availability read
         event_type = get_event_type_for_url(username, url, public_use=False)
-        logger.info(event_type)
         return get_availabilities(event_type)
     except NotFoundError as e:
         raise e
@@ -1,18 +1,58 @@
-import json
-import boto3
 import os
-from datetime import time, datetime, timedelta
-from collections import defaultdict
+from bisect import bisect_right
+from datetime import time, datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 from aws_lambda_powertools import Logger
 from typing import Any, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+from src.common.aws import CLIENT as client, TABLE_NAME
+from src.common.serialization import dumps
 
 INTEGRATIONS_API_URL = os.environ["INTEGRATIONS_API_URL"]
 logger = Logger()
 
+# Shared across warm invocations to overlap independent network calls
+executor = ThreadPoolExecutor(max_workers=4)
+
+# Pooled session so warm invocations reuse the TLS connection to the integrations API
+http = requests.Session()
+http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+http.headers["Connection"] = "keep-alive"
+INTEGRATIONS_API_TIMEOUT = (1.0, 5.0)  # (connect, read) in seconds
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+SECOND = 1_000_000  # in microseconds
+
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_LIMIT = 100
+BATCH_GET_MAX_ATTEMPTS = 5
+
+
+def unmarshal_availability_data(
+    data: dict[str, Any],
+) -> list[list[dict[str, str]]]:
+    """
+    Convert an availability 'data' attribute from DynamoDB attribute values.
+
+    Args:
+        data: The 'data' attribute as returned by the low-level client.
+
+    Returns:
+        A list with one entry per weekday, each a list of dictionaries with 'start'
+        and 'end' keys.
+    """
+    return [
+        [
+            {"start": slot["M"]["start"]["S"], "end": slot["M"]["end"]["S"]}
+            for slot in day["L"]
+        ]
+        for day in data["L"]
+    ]
+
 
 def get_availability(id: str, availability_id: str):
     """
@@ -29,14 +69,18 @@ def get_availability(id: str, availability_id: str):
         NotFoundError: If no availability is found for the given IDs.
     """
     try:
-        response = table.get_item(
-            Key={"id": id, "sortKey": f"AVAILABILITY:{availability_id}"}
+        response = client.get_item(
+            TableName=TABLE_NAME,
+            Key={
+                "id": {"S": id},
+                "sortKey": {"S": f"AVAILABILITY:{availability_id}"},
+            },
         )
 
         if "Item" not in response or "data" not in response["Item"]:
             raise Exception("No availability found for the given IDs.")
 
-        return response["Item"]["data"]
+        return unmarshal_availability_data(response["Item"]["data"])
 
     except Exception as e:
         logger.error(
@@ -45,6 +89,95 @@ def get_availability(id: str, availability_id: str):
         raise e
 
 
+def get_availabilities_bulk(
+    keys: list[Tuple[str, str]],
+) -> dict[Tuple[str, str], list[list[dict[str, str]]]]:
+    """
+    Fetch the availability data for several (ID, availability ID) pairs at once.
+
+    Args:
+        keys: The (id, availability_id) pairs to retrieve.
+
+    Returns:
+        A dictionary mapping each found (id, availability_id) pair to its availability data.
+
+    Raises:
+        Exception: If DynamoDB keeps returning unprocessed keys after retrying.
+    """
+    try:
+        # BatchGetItem rejects duplicate keys within a request
+        keys = list(dict.fromkeys(keys))
+        availabilities = {}
+
+        for i in range(0, len(keys), BATCH_GET_LIMIT):
+            request = {
+                TABLE_NAME: {
+                    "Keys": [
+                        {
+                            "id": {"S": id},
+                            "sortKey": {"S": f"AVAILABILITY:{availability_id}"},
+                        }
+                        for id, availability_id in keys[i : i + BATCH_GET_LIMIT]
+                    ],
+                    "ProjectionExpression": "id, sortKey, #data",
+                    "ExpressionAttributeNames": {"#data": "data"},
+                }
+            }
+
+            for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+                response = client.batch_get_item(RequestItems=request)
+
+                for item in response["Responses"].get(TABLE_NAME, []):
+                    availability_id = item["sortKey"]["S"].partition(":")[2]
+                    availabilities[(item["id"]["S"], availability_id)] = (
+                        unmarshal_availability_data(item["data"])
+                    )
+
+                request = response.get("UnprocessedKeys")
+                if not request:
+                    break
+                # Back off before retrying keys DynamoDB throttled, unless this was
+                # the last attempt
+                if attempt + 1 < BATCH_GET_MAX_ATTEMPTS:
+                    sleep(0.05 * 2**attempt)
+            else:
+                raise Exception("Unprocessed keys remained after retrying.")
+
+        return availabilities
+
+    except Exception as e:
+        logger.error(
+            f"Error fetching availabilities in bulk for {len(keys)} keys. Error: {str(e)}"
+        )
+        raise e
+
+
+def get_events(
+    id: str, start_time: datetime, end_time: datetime
+) -> list[dict[str, str]]:
+    """
+    Fetch the calendar events of a user from the integrations API.
+
+    Args:
+        id: The primary ID of the user whose events to fetch.
+        start_time: The start of the time window.
+        end_time: The end of the time window.
+
+    Returns:
+        A list of events, each with 'start' and 'end' datetimes in ISO format.
+    """
+    try:
+        response = http.get(
+            f"{INTEGRATIONS_API_URL}/events?start_time={start_time.strftime('%Y-%m-%dT%H:%M:%SZ')}&end_time={end_time.strftime('%Y-%m-%dT%H:%M:%SZ')}&id={id}",
+            timeout=INTEGRATIONS_API_TIMEOUT,
+        )
+        return response.json()["events"]
+
+    except Exception as e:
+        logger.error(f"Error fetching events for id {id}. Error: {str(e)}")
+        raise e
+
+
 def get_start_and_end_times() -> Tuple[datetime, datetime]:
     """
     Calculate the start and end times for event availability.
@@ -75,133 +208,282 @@ def get_start_and_end_times() -> Tuple[datetime, datetime]:
         raise e
 
 
-def within_working_hours(
-    working_hours: list[dict[str, str]],
-    time_slot_start: datetime,
-    time_slot_end: datetime,
-) -> bool:
+def seconds_since_midnight(value: time) -> int:
     """
-    Check if a given time slot falls within the provided working hours.
+    Convert a time of day to the number of seconds since midnight.
 
     Args:
-        working_hours: A list of dictionaries representing working hours.
-                       Each dictionary has 'start' and 'end' keys with time values in ISO format.
-        time_slot_start: The start time of the time slot.
-        time_slot_end: The end time of the time slot.
+        value: The time of day.
 
     Returns:
-        True if the time slot falls within the working hours, False otherwise.
+        The number of whole seconds since midnight.
+    """
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def precompute_working_hours(
+    availability_data: list[list[dict[str, str]]],
+) -> list[Tuple[list[int], list[int]]]:
+    """
+    Parse weekly working hours once into sorted seconds-since-midnight lookups.
+
+    Args:
+        availability_data: A list with one entry per weekday, each a list of dictionaries
+                           with 'start' and 'end' keys with time values in ISO format.
+
+    Returns:
+        A list with one (starts, max_ends) pair per weekday. starts holds the range starts
+        in ascending order and max_ends[i] is the latest end among the first i + 1 ranges.
     """
     try:
-        for time_range in working_hours:
-            time_range_start = time.fromisoformat(time_range["start"])
-            time_range_end = time.fromisoformat(time_range["end"])
+        weekly_working_hours = []
 
-            if (
-                time_range_start <= time_slot_start.time() < time_range_end
-                and time_range_start <= time_slot_end.time() <= time_range_end
-            ):
-                return True
+        for working_hours in availability_data:
+            ranges = sorted(
+                (
+                    seconds_since_midnight(time.fromisoformat(time_range["start"])),
+                    seconds_since_midnight(time.fromisoformat(time_range["end"])),
+                )
+                for time_range in working_hours
+            )
 
-        return False
+            starts = []
+            max_ends = []
+            for range_start, range_end in ranges:
+                starts.append(range_start)
+                max_ends.append(max(range_end, max_ends[-1]) if max_ends else range_end)
+
+            weekly_working_hours.append((starts, max_ends))
+
+        return weekly_working_hours
 
     except Exception as e:
-        logger.error(f"Error checking time slot within working hours. Error: {str(e)}")
+        logger.error(f"Error parsing working hours. Error: {str(e)}")
         raise e
 
 
-def overlapping_with_event(
-    events: list[dict[str, str]], time_slot_start: datetime, time_slot_end: datetime
+def within_working_hours(
+    working_hours: Tuple[list[int], list[int]],
+    time_slot_start: int,
+    time_slot_end: int,
 ) -> bool:
     """
-    Check if a given time slot overlaps with any of the provided events.
+    Check if a given time slot falls within the provided working hours.
+
+    Args:
+        working_hours: A (starts, max_ends) pair as returned by precompute_working_hours.
+        time_slot_start: The start time of the time slot, in seconds since midnight.
+        time_slot_end: The end time of the time slot, in seconds since midnight.
+
+    Returns:
+        True if the time slot falls within the working hours, False otherwise.
+    """
+    starts, max_ends = working_hours
+
+    # Ranges that start at or before both ends of the slot; the slot fits in one of
+    # them exactly when the latest of their ends reaches past the slot
+    i = bisect_right(starts, min(time_slot_start, time_slot_end))
+    if i == 0:
+        return False
+
+    return max_ends[i - 1] > time_slot_start and max_ends[i - 1] >= time_slot_end
+
+
+def precompute_working_slots(
+    weekly_working_hours: list[Tuple[list[int], list[int]]], duration_seconds: int
+) -> list[list[int]]:
+    """
+    List, per weekday, the slot offsets from midnight that fall within working hours.
+
+    Args:
+        weekly_working_hours: One (starts, max_ends) pair per weekday, as returned by
+                              precompute_working_hours.
+        duration_seconds: The length of a slot, in seconds.
+
+    Returns:
+        A list with one entry per weekday, each the ascending slot start offsets in
+        seconds since midnight whose slot fits within that day's working hours.
+    """
+    return [
+        [
+            slot_start
+            for slot_start in range(0, 24 * 3600, duration_seconds)
+            if working_hours[0]
+            and within_working_hours(
+                working_hours,
+                slot_start,
+                (slot_start + duration_seconds) % (24 * 3600),
+            )
+        ]
+        for working_hours in weekly_working_hours
+    ]
+
+
+def to_microseconds(value: datetime) -> int:
+    """
+    Convert a datetime to whole microseconds since the Unix epoch.
+
+    Args:
+        value: The datetime to convert. Naive datetimes are treated as UTC.
+
+    Returns:
+        The number of microseconds since 1970-01-01T00:00:00 UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH) // MICROSECOND
+
+
+def precompute_events(events: list[dict[str, str]]) -> Tuple[list[int], list[int]]:
+    """
+    Parse events once into sorted microsecond intervals for overlap lookups.
 
     Args:
         events: A list of dictionaries representing events.
                 Each dictionary has 'start' and 'end' keys with datetime values in ISO format.
-        time_slot_start: The start time of the time slot.
-        time_slot_end: The end time of the time slot.
 
     Returns:
-        True if the time slot overlaps with any event, False otherwise.
+        A (starts, max_ends) pair. starts holds the event starts in ascending order and
+        max_ends[i] is the latest end among the first i + 1 events.
     """
     try:
+        intervals = []
         for event in events:
-            event_start = datetime.fromisoformat(event["start"])
-            event_end = datetime.fromisoformat(event["end"])
+            event_start = to_microseconds(datetime.fromisoformat(event["start"]))
+            event_end = to_microseconds(datetime.fromisoformat(event["end"]))
+            intervals.append((min(event_start, event_end), max(event_start, event_end)))
+        intervals.sort()
 
-            if (
-                (time_slot_start >= event_start and time_slot_start < event_end)
-                or (time_slot_end > event_start and time_slot_end <= event_end)
-                or (time_slot_start < event_start and time_slot_end > event_end)
-            ):
-                return True
+        starts = []
+        max_ends = []
+        for event_start, event_end in intervals:
+            starts.append(event_start)
+            max_ends.append(max(event_end, max_ends[-1]) if max_ends else event_end)
 
-        return False
+        return starts, max_ends
 
     except Exception as e:
-        logger.error(
-            f"Error checking overlap with events. Error: {str(e)}. Events: {events}"
-        )
+        logger.error(f"Error parsing events. Error: {str(e)}. Events: {events}")
         raise e
 
 
-def get_availabilities(event_type: dict[str, Any]) -> dict[str, Any]:
+def get_free_times(
+    availability_data: list[list[dict[str, str]]],
+    events: list[dict[str, str]],
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[str, Any]:
     """
-    Get available time slots for a given event type.
+    Calculate the free time slots between start_time and end_time.
 
     Args:
-        event_type: Dictionary with event type details, specifically 'id' and 'availability_id'.
+        availability_data: A list with one entry per weekday, each a list of dictionaries
+                           with 'start' and 'end' keys with time values in ISO format.
+        events: A list of dictionaries with 'start' and 'end' keys with datetime values
+                in ISO format.
+        start_time: The start of the window, at midnight.
+        end_time: The end of the window.
 
     Returns:
         A dictionary with status code and free time slots in the body.
     """
     try:
-        availability_data = get_availability(
-            event_type["id"], event_type["availability_id"]
+        duration_seconds = 15 * 60  # Assuming duration is in minutes
+
+        # Whether a slot fits the working hours depends only on its weekday and
+        # offset from midnight, so test each combination once rather than per day
+        weekly_working_slots = precompute_working_slots(
+            precompute_working_hours(availability_data), duration_seconds
         )
-        start_time, end_time = get_start_and_end_times()
+        # Each slot's offset from midnight, in microseconds for the overlap checks
+        # and as a timedelta for its output time, is the same on every day
+        weekly_slot_offsets = [
+            [
+                (slot_start * SECOND, timedelta(seconds=slot_start))
+                for slot_start in slots
+            ]
+            for slots in weekly_working_slots
+        ]
+        slot_length = duration_seconds * SECOND
+
+        busy_starts, busy_max_ends = precompute_events(events)
+        end = to_microseconds(end_time)
+
+        # Slots are visited in time order, so the events that start before the
+        # current slot ends only ever grow; advance through them once instead of
+        # searching them per slot
+        busy_count = 0
+
+        freeTimes = {}
+
+        # Walk the window a day at a time so the weekday, working hours and date
+        # string are looked up once per day rather than once per slot. Slots are
+        # offsets from midnight, since start_time always falls on one.
+        for day in range((end_time - start_time).days + 1):
+            day_start = start_time + timedelta(days=day)
+            slot_offsets = weekly_slot_offsets[day_start.weekday()]
+
+            # Days without working hours have no free slots
+            if not slot_offsets:
+                continue
 
-        freeTimes = defaultdict(list)
+            day_start_us = to_microseconds(day_start)
+            day_free_times = []
 
-        response = requests.get(
-            f"{INTEGRATIONS_API_URL}/events?start_time={start_time.strftime('%Y-%m-%dT%H:%M:%SZ')}&end_time={end_time.strftime('%Y-%m-%dT%H:%M:%SZ')}&id={event_type['id']}"
-        )
-        events = response.json()["events"]
+            for offset_us, offset in slot_offsets:
+                time_slot_start = day_start_us + offset_us
+                if time_slot_start > end:
+                    break
 
-        duration_seconds = 15 * 60  # Assuming duration is in minutes
+                time_slot_end = time_slot_start + slot_length
+                while (
+                    busy_count < len(busy_starts)
+                    and busy_starts[busy_count] < time_slot_end
+                ):
+                    busy_count += 1
 
-        time_slot_start = start_time
-        time_slot_end = time_slot_start + timedelta(seconds=duration_seconds)
+                # The slot is busy when any event starting before it ends runs past
+                # its start
+                if busy_count and busy_max_ends[busy_count - 1] > time_slot_start:
+                    continue
 
-        first_loop = True
-        while time_slot_end <= end_time:
-            if not first_loop:
-                time_slot_start += timedelta(seconds=duration_seconds)
-                time_slot_end += timedelta(seconds=duration_seconds)
-            else:
-                first_loop = False
+                # orjson formats naive datetimes like isoformat(), without
+                # building an intermediate string per slot
+                day_free_times.append({"time": day_start + offset, "users": []})
 
-            working_hours = availability_data[time_slot_start.weekday()]
+            # Only days with at least one free slot are listed
+            if day_free_times:
+                freeTimes[day_start.strftime("%Y-%m-%d")] = day_free_times
 
-            if not within_working_hours(working_hours, time_slot_start, time_slot_end):
-                continue
+        return {"statusCode": 200, "body": dumps(freeTimes)}
 
-            if overlapping_with_event(events, time_slot_start, time_slot_end):
-                continue
+    except Exception as e:
+        logger.error(f"Error calculating free time slots. Error: {str(e)}")
+        raise e
 
-            # Extract date from start_time_obj
-            date_str = time_slot_start.strftime("%Y-%m-%d")
 
-            # Create the transformed slot data
-            transformed_slot = {
-                "time": time_slot_start.isoformat(),
-                "users": [],
-            }
-            # Directly append to the defaultdict
-            freeTimes[date_str].append(transformed_slot)
+def get_availabilities(event_type: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get available time slots for a given event type.
+
+    Args:
+        event_type: Dictionary with event type details, specifically 'id' and 'availability_id'.
+
+    Returns:
+        A dictionary with status code and free time slots in the body.
+    """
+    try:
+        start_time, end_time = get_start_and_end_times()
+
+        # The availability row and the calendar events are independent, so fetch
+        # them concurrently instead of paying both round trips back to back
+        availability_future = executor.submit(
+            get_availability, event_type["id"], event_type["availability_id"]
+        )
+        events = get_events(event_type["id"], start_time, end_time)
+        availability_data = availability_future.result()
 
-        return {"statusCode": 200, "body": json.dumps(dict(freeTimes))}
+        return get_free_times(availability_data, events, start_time, end_time)
 
     except Exception as e:
         logger.error(
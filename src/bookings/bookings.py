@@ -1,17 +1,31 @@
-import json
-import boto3
-import os
-import uuid
-from typing import Union, Optional
+import secrets
+from typing import Union
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.event_handler.exceptions import InternalServerError
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+from src.common.aws import (
+    CLIENT as client,
+    DESERIALIZER,
+    PREFIX_KEY_CONDITION,
+    TABLE as table,
+    TABLE_NAME,
+)
 
 
 logger = Logger()
 
+BOOKING_PREFIX = {"S": "BOOKING:"}
+
+# The attributes update() writes and get() reads share one set of placeholders
+BOOKING_ATTRIBUTE_NAMES = {
+    "#name": "name",
+    "#date": "date",
+    "#host": "host",
+    "#guests": "guests",
+}
+BOOKING_PROJECTION = "id, sortKey, #name, #date, #host, #guests"
+BOOKING_UPDATE_EXPRESSION = "SET #name = :n, #date = :d, #host = :h, #guests = :g"
+
 
 def create(
     id: str, booking: dict[str, Union[str, list[str]]]
@@ -30,7 +44,7 @@ def create(
     - Exception: Generic exception if there's an unexpected error during the creation operation.
     """
     try:
-        sortKey = f"BOOKING:{uuid.uuid4()}"
+        sortKey = "BOOKING:" + secrets.token_hex(16)
 
         table.put_item(
             Item={
@@ -56,30 +70,46 @@ def create(
         raise InternalServerError("Internal server error")
 
 
-def convert_to_public_form(booking: dict[str, str]) -> Optional[dict[str, str]]:
+def create_many(
+    id: str, bookings: list[dict[str, Union[str, list[str]]]]
+) -> dict[str, Union[int, str]]:
     """
-    Convert booking data to its public form.
+    Create several booking items in the table with batched writes.
 
     Parameters:
-    - booking (dict): The original booking data.
+    - id (str): The main identifier for the table items.
+    - bookings (list[dict]): The booking data to be stored, one entry per booking.
 
     Returns:
-    - dict or None: The booking data in its public form or None if an exception occurs.
+    - dict: A dictionary containing a statusCode and a body message indicating the result of the operation.
 
-    Note:
-    - Exceptions will be logged using Lambda Powertools.
+    Raises:
+    - Exception: Generic exception if there's an unexpected error during the creation operation.
     """
     try:
-        return {
-            "owner": booking["id"],
-            "booking_id": booking["sortKey"].split(":")[1],
-            "data": booking["data"],
-        }
+        # BatchWriteItem can't carry create()'s attribute_not_exists condition; the
+        # random 128-bit sort keys make a collision with an existing row implausible
+        with table.batch_writer() as batch:
+            for booking in bookings:
+                batch.put_item(
+                    Item={
+                        "id": id,
+                        "sortKey": "BOOKING:" + secrets.token_hex(16),
+                        "name": booking["name"],
+                        "date": booking["date"],
+                        "host": booking["host"],
+                        "guests": booking["guests"],
+                    }
+                )
+
+        logger.info(f"{len(bookings)} booking items for ID {id} created successfully.")
+        return "Items created", 201
+
     except Exception as e:
-        logger.error(
-            f"Error converting booking to public form. Exception: {str(e)}. Booking data: {booking}"
+        logger.exception(
+            f"Error occurred while creating booking items with ID {id}: {str(e)}"
         )
-        return None
+        raise InternalServerError("Internal server error")
 
 
 def get(id: str) -> dict[str, Union[int, str]]:
@@ -96,23 +126,37 @@ def get(id: str) -> dict[str, Union[int, str]]:
     - Exception: Generic exception if there's an unexpected error during the fetch operation.
     """
     try:
-        response = table.query(
-            KeyConditionExpression="id = :id AND begins_with(sortKey, :prefix)",
+        # Follow LastEvaluatedKey so partitions over 1 MB aren't truncated
+        pages = client.get_paginator("query").paginate(
+            TableName=TABLE_NAME,
+            KeyConditionExpression=PREFIX_KEY_CONDITION,
             ExpressionAttributeValues={
-                ":id": id,
-                ":prefix": "BOOKING:",
+                ":id": {"S": id},
+                ":prefix": BOOKING_PREFIX,
             },
+            ProjectionExpression=BOOKING_PROJECTION,
+            ExpressionAttributeNames=BOOKING_ATTRIBUTE_NAMES,
         )
 
-        items = response.get("Items", [])
-        public_items = list(map(convert_to_public_form, items))
+        public_items = [
+            {
+                "owner": booking["id"]["S"],
+                "booking_id": booking["sortKey"]["S"][8:],
+                "name": booking["name"]["S"],
+                "date": booking["date"]["S"],
+                "host": DESERIALIZER.deserialize(booking["host"]),
+                "guests": DESERIALIZER.deserialize(booking["guests"]),
+            }
+            for page in pages
+            for booking in page["Items"]
+        ]
         logger.info(f"Fetched {len(public_items)} booking items for ID {id}.")
 
         return public_items
 
     except Exception as e:
         logger.exception(
-            f"Error occurred while fetching booking items for ID {id}: {str(e)}. Original response: {response}"
+            f"Error occurred while fetching booking items for ID {id}: {str(e)}"
         )
         raise InternalServerError("Internal server error")
 
@@ -139,19 +183,14 @@ def update(
 
         table.update_item(
             Key={"id": id, "sortKey": sortKey},
-            UpdateExpression="SET #name = :n, #date = :d, #host = :h, #guests = :g",
+            UpdateExpression=BOOKING_UPDATE_EXPRESSION,
             ExpressionAttributeValues={
                 ":n": booking["name"],
                 ":d": booking["date"],
                 ":h": booking["host"],
                 ":g": booking["guests"],
             },
-            ExpressionAttributeNames={
-                "#name": "name",
-                "#date": "date",
-                "#host": "host",
-                "#guests": "guests",
-            },
+            ExpressionAttributeNames=BOOKING_ATTRIBUTE_NAMES,
         )
 
         logger.info(
@@ -164,3 +203,45 @@ def update(
             f"Error occurred while updating booking item with ID {id} and sortKey {sortKey}: {str(e)}"
         )
         raise InternalServerError("Internal server error")
+
+
+def update_many(
+    id: str, bookings: dict[str, dict[str, Union[str, list[str]]]]
+) -> dict[str, Union[int, str]]:
+    """
+    Update several booking items in the table with batched writes.
+
+    Parameters:
+    - id (str): The main identifier for the table items.
+    - bookings (dict): Maps each booking_id to its updated booking data.
+
+    Returns:
+    - dict: A dictionary containing a statusCode and a body message indicating the result of the operation.
+
+    Raises:
+    - Exception: Generic exception if there's an unexpected error during the update operation.
+    """
+    try:
+        # update() sets every booking attribute without a condition, so replacing
+        # the whole item with a put has the same effect
+        with table.batch_writer() as batch:
+            for booking_id, booking in bookings.items():
+                batch.put_item(
+                    Item={
+                        "id": id,
+                        "sortKey": f"BOOKING:{booking_id}",
+                        "name": booking["name"],
+                        "date": booking["date"],
+                        "host": booking["host"],
+                        "guests": booking["guests"],
+                    }
+                )
+
+        logger.info(f"{len(bookings)} booking items for ID {id} updated successfully.")
+        return "Items updated"
+
+    except Exception as e:
+        logger.exception(
+            f"Error occurred while updating booking items with ID {id}: {str(e)}"
+        )
+        raise InternalServerError("Internal server error")
@@ -0,0 +1,50 @@
+import os
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+
+# Keep-alive lets warm invocations reuse the same TLS connection to DynamoDB.
+# Short timeouts fail a stuck request quickly enough to retry it inside the
+# Lambda timeout, and adaptive retries back off client-side while throttled.
+config = Config(
+    region_name=os.environ["AWS_REGION"],
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=2,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    max_pool_connections=10,
+)
+
+TABLE_NAME = os.environ["TABLE_NAME"]
+
+dynamodb = boto3.resource("dynamodb", config=config)
+TABLE = dynamodb.Table(TABLE_NAME)
+
+# Low-level client for read paths that unmarshal only the attributes they need,
+# skipping the resource layer's per-attribute TypeDeserializer pass. The resource's
+# own client can't serve them, since boto3 hooks it to convert every request and
+# response to plain Python values, so the resource sends over this client's
+# connection pool instead: one pool, one TLS session per socket, one warm-up call
+CLIENT = boto3.client("dynamodb", config=config)
+TABLE.meta.client._endpoint.http_session = CLIENT._endpoint.http_session
+
+# Key condition for all rows of one user whose sortKey starts with a type prefix,
+# e.g. "BOOKING:"; callers bind :id and :prefix
+PREFIX_KEY_CONDITION = "id = :id AND begins_with(sortKey, :prefix)"
+
+# Shared by client reads that need a whole item as plain Python values
+DESERIALIZER = TypeDeserializer()
+
+
+def _warm() -> None:
+    """
+    Resolve credentials, the endpoint and the TLS session during INIT, where Lambda
+    grants burst CPU, rather than on the first billed invocation.
+    """
+    try:
+        CLIENT.describe_table(TableName=TABLE_NAME)
+    except Exception:
+        pass
+
+
+_warm()
@@ -0,0 +1,17 @@
+from cachetools import TTLCache
+
+# Event type items from the UsernameUrlIndex, keyed by (username, url). Writes in
+# this container drop their user's entries; other containers see a change once
+# its entry expires
+EVENT_TYPE_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+
+def invalidate_event_types(username: str) -> None:
+    """
+    Drop the cached event types of a user.
+
+    Parameters:
+    - username (str): The username whose cached event types to drop.
+    """
+    for key in [key for key in EVENT_TYPE_CACHE if key[0] == username]:
+        EVENT_TYPE_CACHE.pop(key, None)
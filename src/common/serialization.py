@@ -0,0 +1,24 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    # DynamoDB numbers come back as Decimal; encode them as Powertools' Encoder does
+    if isinstance(obj, Decimal):
+        return None if obj.is_nan() else str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string using orjson.
+
+    Parameters:
+    - obj: The object to serialize.
+
+    Returns:
+    - str: The compact JSON representation of the object.
+    """
+    return orjson.dumps(obj, default=_default).decode()
@@ -0,0 +1,202 @@
+from functools import cache
+from typing import Any, Callable
+
+from aws_lambda_powertools.event_handler.exceptions import BadRequestError
+
+
+def is_valid_time(value: str) -> bool:
+    """
+    Check that a string is a 24-hour HH:MM:SS time without running a regex.
+
+    Parameters:
+    - value (str): The string to check.
+
+    Returns:
+    - bool: True if the string is a valid time of day, False otherwise.
+    """
+    return (
+        len(value) == 8
+        and value.isascii()
+        and value[2] == ":"
+        and value[5] == ":"
+        and value[:2].isdigit()
+        and value[3:5].isdigit()
+        and value[6:].isdigit()
+        and value[:2] < "24"
+        and value[3] < "6"
+        and value[6] < "6"
+    )
+
+
+def is_valid_date_time(value: str) -> bool:
+    """
+    Check that a string is a YYYY-MM-DDTHH:MM:SS[.fff...]Z timestamp without running
+    a regex. The fraction is optional, so JavaScript's Date.toISOString() passes.
+
+    Parameters:
+    - value (str): The string to check.
+
+    Returns:
+    - bool: True if the string has the expected timestamp layout, False otherwise.
+    """
+    fraction = value[19:-1]
+    return (
+        len(value) >= 20
+        and value.isascii()
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[-1] == "Z"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:10].isdigit()
+        and value[11:13].isdigit()
+        and value[14:16].isdigit()
+        and value[17:19].isdigit()
+        and (not fraction or (fraction[0] == "." and fraction[1:].isdigit()))
+    )
+
+
+# Custom JSON Schema formats, checked by the functions above instead of `pattern`
+FORMATS = {"time-of-day": is_valid_time, "utc-date-time": is_valid_date_time}
+
+AVAILABILITY_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "availabilities": {
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "start": {"type": "string", "format": "time-of-day"},
+                        "end": {"type": "string", "format": "time-of-day"},
+                    },
+                    "required": ["start", "end"],
+                    "additionalProperties": False,
+                },
+            },
+            "minItems": 7,
+            "maxItems": 7,
+        },
+    },
+    "required": ["name", "availabilities"],
+    "additionalProperties": False,
+}
+
+EVENT_TYPE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "url": {"type": "string"},
+        "duration": {"type": "number"},
+        "availability_id": {"type": "string"},
+        "hidden": {"type": "boolean"},
+    },
+    "required": [
+        "name",
+        "description",
+        "url",
+        "duration",
+        "availability_id",
+        "hidden",
+    ],
+    "additionalProperties": False,
+}
+
+_PERSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "email": {"type": "string"},
+    },
+    "required": ["name", "email"],
+}
+
+BOOKING_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "date": {"type": "string", "format": "utc-date-time"},
+        "host": _PERSON_SCHEMA,
+        "guests": {"type": "array", "items": _PERSON_SCHEMA},
+    },
+    "required": ["name", "date", "host", "guests"],
+    "additionalProperties": False,
+}
+
+# Schemas by the name get_json_body callers refer to them with
+SCHEMAS = {
+    "availability": AVAILABILITY_SCHEMA,
+    "event_type": EVENT_TYPE_SCHEMA,
+    "booking": BOOKING_SCHEMA,
+}
+
+
+def get_query_params(query_params: dict[str, str], *names: str) -> dict[str, str]:
+    """
+    Check that the query string parameters of a request contain the given names.
+
+    Parameters:
+    - query_params (dict): The query string parameters of the request.
+    - names (str): Query string parameters that must be present.
+
+    Returns:
+    - dict: The query string parameters of the request.
+
+    Raises:
+    - BadRequestError: When a required parameter is missing.
+    """
+    missing = [name for name in names if name not in query_params]
+    if missing:
+        raise BadRequestError(
+            f"Missing required query string parameters: {', '.join(missing)}"
+        )
+    return query_params
+
+
+@cache
+def _get_validator(schema_name: str) -> Callable[[Any], Any]:
+    # Compiling a schema generates and execs Python source, so do it once per
+    # schema and reuse the validator on warm invocations
+    import fastjsonschema
+
+    return fastjsonschema.compile(SCHEMAS[schema_name], formats=FORMATS)
+
+
+def get_json_body(event: Any, schema_name: str) -> dict[str, Any]:
+    """
+    Parse the JSON body of a request and validate it against a JSON Schema.
+
+    Parameters:
+    - event: The current API Gateway event.
+    - schema_name (str): The key in SCHEMAS of the schema the body must satisfy.
+
+    Returns:
+    - dict: The parsed request body.
+
+    Raises:
+    - BadRequestError: When the body is not valid JSON or does not match the schema.
+    """
+    # Only writes carry a body, so reads never load the schema validator
+    import fastjsonschema
+
+    try:
+        body = event.json_body
+    except (TypeError, ValueError):
+        raise BadRequestError("Request body must be valid JSON")
+
+    try:
+        _get_validator(schema_name)(body)
+    except fastjsonschema.JsonSchemaValueException as e:
+        raise BadRequestError(f"Invalid request body: {e.message}")
+
+    return body
@@ -1,7 +1,6 @@
-import uuid
-import boto3
-import os
-from typing import Tuple, Union, Optional
+import secrets
+from decimal import Decimal
+from typing import Tuple, Union
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.event_handler.exceptions import (
@@ -9,44 +8,31 @@ from aws_lambda_powertools.event_handler.exceptions import (
     NotFoundError,
 )
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+from src.common.aws import (
+    CLIENT as client,
+    PREFIX_KEY_CONDITION,
+    TABLE as table,
+    TABLE_NAME,
+)
+from src.common.cache import invalidate_event_types
 
 logger = Logger()
 
+EVENT_PREFIX = {"S": "EVENT:"}
 
-def convert_to_public_form(
-    event_type: dict[str, Union[str, int, bool]]
-) -> Optional[dict[str, Union[str, int, bool]]]:
-    """
-    Convert event type data to a public form.
+EVENT_TYPE_UPDATE_NAMES = {
+    "#name": "name",
+    "#description": "description",
+    "#url": "url",
+    "#duration": "duration",
+    "#availability_id": "availability_id",
+    "#hidden": "hidden",
+}
+EVENT_TYPE_UPDATE_EXPRESSION = "SET #name = :n, #description = :d, #url = :url, #duration = :dur, #availability_id = :id, #hidden = :h"
 
-    Parameters:
-    - event_type (dict): Contains the raw event type data.
-
-    Returns:
-    - dict or None: The event type in the desired public format or None if there's an exception during conversion.
-
-    Note:
-    If any exception occurs during conversion, this function will log the error and return None.
-    """
-    try:
-        return {
-            "owner": event_type["id"],
-            "event_type_id": event_type["sortKey"].split(":")[1],
-            "name": event_type["name"],
-            "description": event_type["description"],
-            "url": event_type["url"],
-            "duration": int(event_type["duration"]),
-            "availability_id": event_type["availability_id"],
-            "hidden": event_type["hidden"],
-            "username": event_type["username"],
-        }
-    except Exception as e:
-        logger.exception(
-            f"Error occurred while converting event type to public form: {str(e)} - Event type data: {event_type}"
-        )
-        return None
+# get() also reads the username, which update() never changes
+EVENT_TYPE_PROJECTION_NAMES = {**EVENT_TYPE_UPDATE_NAMES, "#username": "username"}
+EVENT_TYPE_PROJECTION = "id, sortKey, #name, #description, #url, #duration, #availability_id, #hidden, #username"
 
 
 def get(id: str) -> list[dict[str, Union[str, int, bool]]]:
@@ -59,20 +45,37 @@ def get(id: str) -> list[dict[str, Union[str, int, bool]]]:
     Returns:
     - list[dict]: A list of event items in the desired public format.
 
-    Note:
-    If any exception occurs during retrieval, this function will log the error.
+    Raises:
+    - InternalServerError: When an error occurs during retrieval. The error is logged first.
     """
     try:
-        response = table.query(
-            KeyConditionExpression="id = :id AND begins_with(sortKey, :prefix)",
+        # Follow LastEvaluatedKey so partitions over 1 MB aren't truncated
+        pages = client.get_paginator("query").paginate(
+            TableName=TABLE_NAME,
+            KeyConditionExpression=PREFIX_KEY_CONDITION,
             ExpressionAttributeValues={
-                ":id": id,
-                ":prefix": "EVENT:",
+                ":id": {"S": id},
+                ":prefix": EVENT_PREFIX,
             },
+            ProjectionExpression=EVENT_TYPE_PROJECTION,
+            ExpressionAttributeNames=EVENT_TYPE_PROJECTION_NAMES,
         )
 
-        items = response.get("Items", [])
-        public_items = list(map(convert_to_public_form, items))
+        public_items = [
+            {
+                "owner": event_type["id"]["S"],
+                "event_type_id": event_type["sortKey"]["S"][6:],
+                "name": event_type["name"]["S"],
+                "description": event_type["description"]["S"],
+                "url": event_type["url"]["S"],
+                "duration": int(Decimal(event_type["duration"]["N"])),
+                "availability_id": event_type["availability_id"]["S"],
+                "hidden": event_type["hidden"]["BOOL"],
+                "username": event_type["username"]["S"],
+            }
+            for page in pages
+            for event_type in page["Items"]
+        ]
 
         logger.info(f"Retrieved {len(public_items)} event items for ID {id}.")
         return public_items
@@ -81,7 +84,7 @@ def get(id: str) -> list[dict[str, Union[str, int, bool]]]:
         logger.exception(
             f"Unexpected error occurred while retrieving event items for ID {id}: {str(e)}"
         )
-    raise InternalServerError("Internal server error")
+        raise InternalServerError("Internal server error") from e
 
 
 def create(id: str, event_type: dict[str, Union[str, int, bool]]) -> Tuple[str, int]:
@@ -100,7 +103,7 @@ def create(id: str, event_type: dict[str, Union[str, int, bool]]) -> Tuple[str,
     - InternalServerError: When a non-conditional error occurs.
     """
     try:
-        sortKey = f"EVENT:{uuid.uuid4()}"
+        sortKey = "EVENT:" + secrets.token_hex(16)
 
         table.put_item(
             Item={
@@ -116,6 +119,9 @@ def create(id: str, event_type: dict[str, Union[str, int, bool]]) -> Tuple[str,
             },
         )
 
+        # Event types are stored with the owner's id as their username
+        invalidate_event_types(id)
+
         logger.info(
             f"Event_Type with ID {id} and sortKey {sortKey} created successfully."
         )
@@ -128,6 +134,52 @@ def create(id: str, event_type: dict[str, Union[str, int, bool]]) -> Tuple[str,
         raise InternalServerError("Internal server error")
 
 
+def create_many(
+    id: str, event_types: list[dict[str, Union[str, int, bool]]]
+) -> Tuple[str, int]:
+    """
+    Create several event items in the table with batched writes.
+
+    Parameters:
+    - id (str): The main identifier for the table items.
+    - event_types (list[dict]): The event type data to be stored, one entry per event type.
+
+    Returns:
+    - Tuple[str, int]: A tuple containing a message string and a statusCode indicating the result of the operation.
+
+    Raises:
+    - InternalServerError: When an error occurs during the creation operation.
+    """
+    try:
+        # batch_writer sends up to 25 puts per BatchWriteItem and retries unprocessed items
+        with table.batch_writer() as batch:
+            for event_type in event_types:
+                batch.put_item(
+                    Item={
+                        "id": id,
+                        "sortKey": "EVENT:" + secrets.token_hex(16),
+                        "name": event_type["name"],
+                        "description": event_type["description"],
+                        "url": event_type["url"],
+                        "duration": event_type["duration"],
+                        "availability_id": event_type["availability_id"],
+                        "hidden": event_type["hidden"],
+                        "username": id,
+                    }
+                )
+
+        invalidate_event_types(id)
+
+        logger.info(f"{len(event_types)} event items for ID {id} created successfully.")
+        return "Items created", 201
+
+    except Exception as e:
+        logger.exception(
+            f"Unexpected error occurred while creating event items with ID {id}: {str(e)}"
+        )
+        raise InternalServerError("Internal server error")
+
+
 def update(
     id: str, event_type_id: str, event_type: dict[str, Union[str, int, bool]]
 ) -> str:
@@ -151,7 +203,7 @@ def update(
 
         table.update_item(
             Key={"id": id, "sortKey": sortKey},
-            UpdateExpression="SET #name = :n, #description = :d, #url = :url, #duration = :dur, #availability_id = :id, #hidden = :h",
+            UpdateExpression=EVENT_TYPE_UPDATE_EXPRESSION,
             ExpressionAttributeValues={
                 ":n": event_type["name"],
                 ":d": event_type["description"],
@@ -160,17 +212,12 @@ def update(
                 ":id": event_type["availability_id"],
                 ":h": event_type["hidden"],
             },
-            ExpressionAttributeNames={
-                "#name": "name",
-                "#description": "description",
-                "#url": "url",
-                "#duration": "duration",
-                "#availability_id": "availability_id",
-                "#hidden": "hidden",
-            },
+            ExpressionAttributeNames=EVENT_TYPE_UPDATE_NAMES,
             ConditionExpression="attribute_exists(id) AND attribute_exists(sortKey)",
         )
 
+        invalidate_event_types(id)
+
         logger.info(
             f"Event item with ID {id} and sortKey {sortKey} updated successfully."
         )
@@ -218,6 +265,8 @@ def delete(id: str, event_type_id: str) -> str:
             ConditionExpression="attribute_exists(id) AND attribute_exists(sortKey)",
         )
 
+        invalidate_event_types(id)
+
         logger.info(
             f"Event type with ID {id} and sortKey {sortKey} deleted successfully."
         )
@@ -0,0 +1,14 @@
+import os
+
+# The Lambda modules read their settings from the environment at import time
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("TABLE_NAME", "Meetings")
+os.environ.setdefault("INTEGRATIONS_API_URL", "https://integrations.example.com")
+
+# Unit tests stub every AWS call; make sure the INIT warm-up in src.common.aws can
+# never reach a real account, and fails fast against a closed local port
+os.environ["AWS_ENDPOINT_URL_DYNAMODB"] = "http://127.0.0.1:9"
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ.pop("AWS_SESSION_TOKEN", None)
+os.environ.pop("AWS_PROFILE", None)
@@ -0,0 +1,5 @@
+from src.common.aws import CLIENT, TABLE
+
+
+def test_table_and_client_share_one_connection_pool():
+    assert TABLE.meta.client._endpoint.http_session is CLIENT._endpoint.http_session
@@ -0,0 +1,61 @@
+import pytest
+from aws_lambda_powertools.event_handler.exceptions import NotFoundError
+from botocore.stub import Stubber
+
+import src.book.book as book
+import src.book.calculate_availability as calculate_availability
+from src.common.aws import CLIENT
+
+RESERVED = "RESERVED_FOR_INTERNAL_USE_ONLY"
+
+
+def event_type_item(url, hidden=False):
+    return {
+        "name": {"S": f"Event {url}"},
+        "description": {"S": "Description"},
+        "duration": {"N": "30"},
+        "url": {"S": url},
+        "hidden": {"BOOL": hidden},
+    }
+
+
+def test_get_event_types_for_username_skips_reserved_and_hidden_rows():
+    items = [
+        # The reserved row only marks that the user exists
+        {"url": {"S": RESERVED}},
+        event_type_item("intro"),
+        event_type_item("secret", hidden=True),
+    ]
+
+    with Stubber(CLIENT) as stubber:
+        stubber.add_response("query", {"Items": items})
+
+        event_types = book.get_event_types_for_username("u")
+
+    assert event_types == [
+        {"name": "Event intro", "description": "Description", "duration": 30}
+    ]
+
+
+@pytest.fixture
+def calendar_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        calculate_availability.http,
+        "get",
+        lambda *args, **kwargs: calls.append(args),
+    )
+    return calls
+
+
+@pytest.mark.parametrize("url", [RESERVED, "missing"])
+def test_get_availabilities_for_url_skips_calendar_for_unknown_url(url, calendar_calls):
+    with Stubber(CLIENT) as stubber:
+        if url != RESERVED:
+            stubber.add_response("query", {"Items": []})
+
+        with pytest.raises(NotFoundError):
+            book.get_availabilities_for_url("u", url)
+        stubber.assert_no_pending_responses()
+
+    assert calendar_calls == []
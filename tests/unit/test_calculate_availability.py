@@ -0,0 +1,270 @@
+import json
+import random
+from datetime import datetime, time, timedelta
+
+import pytest
+from botocore.stub import Stubber
+
+import src.book.calculate_availability as calculate_availability
+from src.common.aws import CLIENT, TABLE_NAME
+
+WORKDAY = [{"start": "09:00:00", "end": "17:00:00"}]
+WEDNESDAY = datetime(2026, 10, 14)
+
+
+def availability_key(id, availability_id):
+    return {"id": {"S": id}, "sortKey": {"S": f"AVAILABILITY:{availability_id}"}}
+
+
+def availability_item(id, availability_id, data):
+    return {
+        **availability_key(id, availability_id),
+        "data": {
+            "L": [
+                {
+                    "L": [
+                        {"M": {"start": {"S": r["start"]}, "end": {"S": r["end"]}}}
+                        for r in day
+                    ]
+                }
+                for day in data
+            ]
+        },
+    }
+
+
+def batch_get_request(keys):
+    return {
+        TABLE_NAME: {
+            "Keys": keys,
+            "ProjectionExpression": "id, sortKey, #data",
+            "ExpressionAttributeNames": {"#data": "data"},
+        }
+    }
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(calculate_availability, "sleep", calls.append)
+    return calls
+
+
+def test_get_availabilities_bulk_retries_unprocessed_keys(sleeps):
+    week = [[], *[WORKDAY] * 5, []]
+    unprocessed = batch_get_request([availability_key("u", "b")])
+
+    with Stubber(CLIENT) as stubber:
+        stubber.add_response(
+            "batch_get_item",
+            {
+                "Responses": {TABLE_NAME: [availability_item("u", "a", week)]},
+                "UnprocessedKeys": unprocessed,
+            },
+            # The duplicate key is sent once
+            {
+                "RequestItems": batch_get_request(
+                    [availability_key("u", "a"), availability_key("u", "b")]
+                )
+            },
+        )
+        stubber.add_response(
+            "batch_get_item",
+            {"Responses": {TABLE_NAME: [availability_item("u", "b", week)]}},
+            {"RequestItems": unprocessed},
+        )
+
+        availabilities = calculate_availability.get_availabilities_bulk(
+            [("u", "a"), ("u", "b"), ("u", "a")]
+        )
+        stubber.assert_no_pending_responses()
+
+    assert availabilities == {("u", "a"): week, ("u", "b"): week}
+    assert len(sleeps) == 1
+
+
+def test_get_availabilities_bulk_gives_up_without_a_final_backoff(sleeps):
+    unprocessed = batch_get_request([availability_key("u", "a")])
+
+    with Stubber(CLIENT) as stubber:
+        for _ in range(calculate_availability.BATCH_GET_MAX_ATTEMPTS):
+            stubber.add_response(
+                "batch_get_item",
+                {"Responses": {}, "UnprocessedKeys": unprocessed},
+                {"RequestItems": unprocessed},
+            )
+
+        with pytest.raises(Exception, match="Unprocessed keys"):
+            calculate_availability.get_availabilities_bulk([("u", "a")])
+        stubber.assert_no_pending_responses()
+
+    assert len(sleeps) == calculate_availability.BATCH_GET_MAX_ATTEMPTS - 1
+
+
+def reference_free_times(availability_data, events, start_time, end_time):
+    # The slot loop as it was before it was rewritten around precomputed lookups,
+    # kept as the oracle for get_free_times
+    free_times = {}
+    duration = timedelta(minutes=15)
+
+    time_slot_start = start_time
+    time_slot_end = time_slot_start + duration
+
+    first_loop = True
+    while time_slot_end <= end_time:
+        if not first_loop:
+            time_slot_start += duration
+            time_slot_end += duration
+        else:
+            first_loop = False
+
+        within_working_hours = any(
+            time.fromisoformat(r["start"])
+            <= time_slot_start.time()
+            < time.fromisoformat(r["end"])
+            and time.fromisoformat(r["start"])
+            <= time_slot_end.time()
+            <= time.fromisoformat(r["end"])
+            for r in availability_data[time_slot_start.weekday()]
+        )
+        if not within_working_hours:
+            continue
+
+        overlapping_with_event = False
+        for event in events:
+            event_start = datetime.fromisoformat(event["start"])
+            event_end = datetime.fromisoformat(event["end"])
+            if (
+                (event_start <= time_slot_start < event_end)
+                or (event_start < time_slot_end <= event_end)
+                or (time_slot_start < event_start and time_slot_end > event_end)
+            ):
+                overlapping_with_event = True
+                break
+        if overlapping_with_event:
+            continue
+
+        free_times.setdefault(time_slot_start.strftime("%Y-%m-%d"), []).append(
+            {"time": time_slot_start.isoformat(), "users": []}
+        )
+
+    return free_times
+
+
+def free_times(availability_data, events, start_time, end_time):
+    response = calculate_availability.get_free_times(
+        availability_data, events, start_time, end_time
+    )
+    assert response["statusCode"] == 200
+    return json.loads(response["body"])
+
+
+def free_slots(availability_data, events, implementation=free_times):
+    # The HH:MM start of each free slot on WEDNESDAY
+    day = WEDNESDAY
+    end_time = day + timedelta(days=1) - timedelta(microseconds=1)
+    result = implementation(availability_data, events, day, end_time)
+    return [slot["time"][11:16] for slot in result.get(day.strftime("%Y-%m-%d"), [])]
+
+
+def every_day(*ranges):
+    return [[{"start": start, "end": end} for start, end in ranges]] * 7
+
+
+def event(start, end, day="2026-10-14"):
+    return {"start": f"{day}T{start}", "end": f"{day}T{end}"}
+
+
+def test_overlapping_working_hours_form_one_block():
+    availability = every_day(("08:00:00", "12:00:00"), ("11:00:00", "18:00:00"))
+
+    slots = free_slots(availability, [])
+
+    assert slots[0] == "08:00" and slots[-1] == "17:45" and len(slots) == 40
+    assert slots == free_slots(availability, [], reference_free_times)
+
+
+def test_last_slot_of_the_day_ends_at_midnight():
+    # The 23:45 slot ends at 00:00, so only a range starting at midnight can hold it
+    for implementation in (free_times, reference_free_times):
+        full_day = free_slots(every_day(("00:00:00", "23:59:59")), [], implementation)
+        evening = free_slots(every_day(("22:00:00", "23:59:59")), [], implementation)
+
+        assert full_day[-1] == "23:45"
+        assert evening[-1] == "23:30"
+
+
+def test_zero_length_events():
+    availability = every_day(("09:00:00", "11:00:00"))
+
+    on_boundary = [event("10:00:00", "10:00:00")]
+    inside_slot = [event("10:05:00", "10:05:00")]
+
+    # On a slot boundary an empty event touches no slot; inside a slot it blocks it
+    for implementation in (free_times, reference_free_times):
+        assert "10:00" in free_slots(availability, on_boundary, implementation)
+        assert "10:00" not in free_slots(availability, inside_slot, implementation)
+
+
+def test_reversed_events_block_the_span_between_their_ends():
+    availability = every_day(("09:00:00", "12:00:00"))
+    events = [event("11:00:00", "10:00:00")]
+
+    slots = free_slots(availability, events)
+
+    assert slots == free_slots(availability, [event("10:00:00", "11:00:00")])
+    assert slots == free_slots(availability, events, reference_free_times)
+    assert "09:45" in slots and "10:00" not in slots and "11:00" in slots
+
+
+def test_aware_event_times_are_compared_in_utc():
+    availability = every_day(("09:00:00", "12:00:00"))
+    naive = free_slots(availability, [event("10:00:00", "10:30:00")])
+
+    assert naive == free_slots(availability, [event("10:00:00Z", "10:30:00Z")])
+    assert naive == free_slots(
+        availability, [event("12:00:00+02:00", "12:30:00+02:00")]
+    )
+    assert "10:00" not in naive and "10:30" in naive
+
+
+def random_time(rng):
+    return time(rng.randrange(24), rng.choice([0, 10, 15, 30, 45])).isoformat()
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_get_free_times_matches_reference(seed):
+    rng = random.Random(seed)
+
+    # get_start_and_end_times always starts the window at a midnight and ends it
+    # on the last microsecond of a day
+    start_time = datetime(2026, 10, 11) + timedelta(days=rng.randrange(28))
+    end_time = (
+        start_time + timedelta(days=rng.randrange(1, 49)) - timedelta(microseconds=1)
+    )
+
+    availability = [
+        [
+            {"start": random_time(rng), "end": random_time(rng)}
+            for _ in range(rng.randrange(3))
+        ]
+        for _ in range(7)
+    ]
+
+    events = []
+    for _ in range(rng.randrange(30)):
+        event_start = start_time + timedelta(
+            days=rng.uniform(-2, (end_time - start_time).days + 2)
+        )
+        event_start = event_start.replace(second=0, microsecond=0)
+        event_length = timedelta(minutes=rng.choice([0, 7, 15, 30, 60, 240, -30]))
+        events.append(
+            {
+                "start": event_start.isoformat(),
+                "end": (event_start + event_length).isoformat(),
+            }
+        )
+
+    assert free_times(availability, events, start_time, end_time) == (
+        reference_free_times(availability, events, start_time, end_time)
+    )
@@ -6,7 +6,8 @@ from meetings_cdk.meetings_cdk_stack import MeetingsCdkStack
 # example tests. To run these tests, uncomment this file along with the example
 # resource in meetings_cdk/meetings_cdk_stack.py
 def test_sqs_queue_created():
-    app = core.App()
+    # Asset bundling runs in Docker, which unit tests should not depend on
+    app = core.App(context={"aws:cdk:bundling-stacks": []})
     stack = MeetingsCdkStack(app, "meetings-cdk")
     template = assertions.Template.from_stack(stack)
 
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+from aws_lambda_powertools.event_handler.exceptions import BadRequestError
+from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEventV2
+
+from src.common.validation import (
+    get_json_body,
+    get_query_params,
+    is_valid_date_time,
+    is_valid_time,
+)
+
+WORKDAY = [{"start": "09:00:00", "end": "17:00:00"}]
+
+
+def make_event(body):
+    return APIGatewayProxyEventV2({"body": body})
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("00:00:00", True),
+        ("09:30:15", True),
+        ("23:59:59", True),
+        ("24:00:00", False),
+        ("12:60:00", False),
+        ("12:00:60", False),
+        ("9:00:00", False),
+        ("09:00", False),
+        ("09-00-00", False),
+        ("0a:00:00", False),
+        # Arabic-Indic digits pass str.isdigit() but are not ASCII
+        ("١٢:00:00", False),
+        ("", False),
+    ],
+)
+def test_is_valid_time(value, expected):
+    assert is_valid_time(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2026-10-14T10:00:00Z", True),
+        ("2026-10-14T23:59:59Z", True),
+        # Date.prototype.toISOString() adds milliseconds
+        ("2026-10-14T10:00:00.000Z", True),
+        ("2026-10-14T10:00:00.123456Z", True),
+        ("2026-10-14T10:00:00.Z", False),
+        ("2026-10-14T10:00:00.12aZ", False),
+        ("2026-10-14T10:00:00Z0", False),
+        ("2026-10-14T10:00:00", False),
+        ("2026-10-14 10:00:00Z", False),
+        ("2026-10-14T10:00:00+00:00", False),
+        ("2026/10/14T10:00:00Z", False),
+        ("2026-10-14T10:00:0aZ", False),
+        ("٢026-10-14T10:00:00Z", False),
+        ("", False),
+    ],
+)
+def test_is_valid_date_time(value, expected):
+    assert is_valid_date_time(value) is expected
+
+
+def test_get_query_params_lists_missing_names():
+    with pytest.raises(BadRequestError, match="id, name"):
+        get_query_params({"other": "x"}, "id", "name")
+
+    assert get_query_params({"id": "u"}, "id") == {"id": "u"}
+
+
+def test_get_json_body_returns_valid_body():
+    body = {"name": "Work", "availabilities": [[], *[WORKDAY] * 5, []]}
+
+    assert get_json_body(make_event(json.dumps(body)), "availability") == body
+
+
+@pytest.mark.parametrize(
+    "schema_name, body",
+    [
+        ("availability", None),
+        ("availability", "not json"),
+        ("availability", json.dumps({"name": "Work"})),
+        ("availability", json.dumps({"name": "Work", "availabilities": [WORKDAY] * 6})),
+        (
+            "availability",
+            json.dumps(
+                {
+                    "name": "Work",
+                    "availabilities": [[{"start": "24:00:00", "end": "17:00:00"}]] * 7,
+                }
+            ),
+        ),
+        (
+            "booking",
+            json.dumps(
+                {
+                    "name": "Meeting",
+                    "date": "2026-10-14T10:00:00",
+                    "host": {"name": "Host", "email": "host@example.com"},
+                    "guests": [],
+                }
+            ),
+        ),
+    ],
+)
+def test_get_json_body_rejects_invalid_body(schema_name, body):
+    with pytest.raises(BadRequestError):
+        get_json_body(make_event(body), schema_name)